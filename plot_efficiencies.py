@@ -1,216 +1,510 @@
 #!/usr/bin/env python3
 """Plot corrected pump efficiencies from CSV data (MPa version with clean legends)."""
 
+import hashlib
+import itertools
+import multiprocessing
 import os
-import matplotlib.pyplot as plt
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 import numpy as np
 
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+except ImportError:  # optional, pandas' own parser is used without it
+    pa = pa_csv = None
+
 DATA_FILE = "V32HL56-efficiency.csv"
 OUTPUT_DIR = "corrected_plots"
 Output_sepa= "Efficiency_plots"
 
+EFFICIENCY_LABELS = {
+    "Etat": "Overall Efficiency (Etat) [%]",
+    "Etav": "Volumetric Efficiency (Etav) [%]",
+    "Etam": "Hydromechanical Efficiency (Etam) [%]"
+}
+
+# Single precision is plenty for the measured values and halves the memory.
+# Δp stays double so the tolerance window in plot_efficiencies_sep selects
+# exactly the rows it would on the parsed values (float32(31.8) < 31.8).
+COLUMN_DTYPES = {
+    "Speed": "float32",
+    "Displacement": "float32",
+    "Deltap": "float64",
+    "Etat": "float32",
+    "Etav": "float32",
+    "Etam": "float32",
+}
+
+# Operating point keys and the columns averaged over each of them. The
+# measured Δp is kept so plot_efficiencies_sep can still select on it.
+GROUP_KEYS = ["RoundedDisplacement", "RoundedDeltap", "Speed"]
+MEAN_COLUMNS = ["Deltap", *EFFICIENCY_LABELS]
+
+# Bump when the rounding or aggregation changes so old Parquet caches are
+# not reused; the key/column lists above are part of the cache key already
+CACHE_VERSION = 1
+
+# Maps are saved at a fixed resolution, independent of rcParams
+MAP_DPI = 100
+
+# The CSV is read in chunks of roughly this size to bound memory
+CHUNK_ROWS = 200_000
+CHUNK_BYTES = 32 << 20
+
+# Figures are cached per process and cleared between plots instead of being
+# rebuilt for every PNG.
+_FIGURES = {}
+
+# PNG encoding runs on a small thread pool so it overlaps with building the
+# next plot. _PENDING maps each figure to its in-flight save.
+SAVE_THREADS = 2
+_SAVER = None
+_PENDING = {}
+
+
+def _reset_saver():
+    # Threads do not survive a fork, so a child must start its own pool
+    global _SAVER
+    _SAVER = None
+    _PENDING.clear()
+
+
+# POSIX only; spawned children re-import the module and start fresh anyway
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_saver)
+
+
 def load_and_prepare_data(file_path: str = DATA_FILE):
-    df = pd.read_csv(file_path)
+    """Read the CSV and average the efficiencies per operating point.
+
+    The file is streamed in chunks and each chunk is reduced to per
+    (displacement, Δp, speed) sums and counts, so peak memory stays bounded
+    by the chunk size rather than the file size. The result is one row per
+    operating point with the mean measured Δp and efficiencies; every plot
+    function works on this table.
+
+    The result is cached next to the CSV as Parquet (when pyarrow is
+    available) and reused for as long as it is newer than the CSV. The cache
+    file name carries a key of the aggregation schema, so a cache written by
+    a different version of this code is never read.
+    """
+    cache_path = _cache_path(file_path)
+    df = _read_cache(cache_path, file_path)
+    if df is None:
+        df = _aggregate_csv(file_path)
+        _write_cache(df, cache_path)
+
+    # Both keys have only a handful of distinct values, so store them as
+    # categoricals to make grouping on them cheap.
+    df["RoundedDisplacement"] = pd.Categorical(df["RoundedDisplacement"])
+    df["RoundedDeltap"] = pd.Categorical(df["RoundedDeltap"])
+
+    return df
 
-    # Round displacement to nearest cc and Δp to the nearest 0.1 MPa
-    df["RoundedDisplacement"] = df["Displacement"].round().astype(int)
-    df["RoundedDeltap"] = df["Deltap"].round(1)  # e.g., 8.0 MPa, 8.5 MPa
+
+def _cache_path(file_path: str):
+    schema = repr((CACHE_VERSION, GROUP_KEYS, MEAN_COLUMNS, COLUMN_DTYPES))
+    key = hashlib.sha1(schema.encode()).hexdigest()[:8]
+    return f"{os.path.splitext(file_path)[0]}.{key}.parquet"
+
+
+# Columns of the aggregated table that are not float32
+_AGGREGATE_DTYPES = {"RoundedDisplacement": np.int32, "Deltap": np.float64}
+
+
+def _read_cache(cache_path: str, file_path: str):
+    if pa is None or not os.path.exists(cache_path) \
+            or os.path.getmtime(cache_path) < os.path.getmtime(file_path):
+        return None
+    try:
+        return pd.read_parquet(cache_path)
+    except (OSError, ValueError):  # unreadable cache, treat it as a miss
+        return None
+
+
+def _write_cache(df: pd.DataFrame, cache_path: str):
+    if pa is None:
+        return
+    # Write next to the target and move it into place, so an interrupted
+    # write never leaves a truncated cache behind
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        df.to_parquet(tmp_path, compression="zstd")
+        os.replace(tmp_path, cache_path)
+    except OSError:  # e.g. read-only data directory or full disk, skip caching
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _aggregate_csv(file_path: str):
+    partials = []
+    for chunk in _read_csv_chunks(file_path):
+        chunk = _add_rounded_columns(chunk)
+        partials.append(
+            chunk.groupby(GROUP_KEYS)[MEAN_COLUMNS].agg(["sum", "count"])
+        )
+
+    if not partials:  # header-only file, no chunks to merge
+        return pd.DataFrame({
+            col: np.array([], dtype=_AGGREGATE_DTYPES.get(col, np.float32))
+            for col in GROUP_KEYS + MEAN_COLUMNS
+        })
+
+    totals = pd.concat(partials).groupby(level=GROUP_KEYS).sum()
+    means = totals.xs("sum", axis=1, level=1) / totals.xs("count", axis=1, level=1)
+    return means.astype({col: np.float32 for col in EFFICIENCY_LABELS}).reset_index()
+
+
+def _read_csv_chunks(file_path: str):
+    if pa_csv is None:  # pyarrow not installed, fall back to the C parser
+        yield from pd.read_csv(file_path, usecols=list(COLUMN_DTYPES), dtype=COLUMN_DTYPES,
+                               chunksize=CHUNK_ROWS)
+        return
+
+    reader = pa_csv.open_csv(
+        file_path,
+        read_options=pa_csv.ReadOptions(block_size=CHUNK_BYTES),
+        convert_options=pa_csv.ConvertOptions(
+            column_types={k: pa.type_for_alias(v) for k, v in COLUMN_DTYPES.items()},
+            include_columns=list(COLUMN_DTYPES),
+        ),
+    )
+    for batch in reader:
+        yield batch.to_pandas()
+
+
+def _add_rounded_columns(df: pd.DataFrame):
+    # Rows without a displacement or Δp belong to no operating point; drop them
+    # before the integer cast would turn NaN into a bogus displacement
+    df = df.dropna(subset=["Displacement", "Deltap"])
+
+    # Round displacement to nearest cc and Δp to the nearest 0.1 MPa, straight
+    # on the float32 arrays rather than through pandas' rounding dispatch
+    df["RoundedDisplacement"] = np.rint(df["Displacement"].to_numpy()).astype(np.int32)
+    df["RoundedDeltap"] = np.round(df["Deltap"].to_numpy(dtype=np.float32), 1)  # e.g., 8.0 MPa, 8.5 MPa
 
     return df
 
 
-def plot_efficiencies(df: pd.DataFrame, output_dir=OUTPUT_DIR):
+def _matplotlib():
+    """Import matplotlib on first use so loading data alone skips it.
+
+    Figures are built on the Agg canvas directly rather than through pyplot,
+    whose global state is not safe to share with the saver threads.
+    """
+    import matplotlib
+    import matplotlib.backends.backend_agg
+    import matplotlib.collections
+    import matplotlib.figure
+    import matplotlib.lines
+    return matplotlib
+
+
+def _reusable_axes(name):
+    """Return the cached figure/axes pair for ``name`` with the axes cleared."""
+    if name not in _FIGURES:
+        mpl = _matplotlib()
+        # Constrained layout makes room for legends/colorbars while drawing and
+        # saves the full 800x600 figure; savefig still runs its layout pre-draw
+        fig = mpl.figure.Figure(figsize=(8, 6), layout="constrained")
+        mpl.backends.backend_agg.FigureCanvasAgg(fig)
+        _FIGURES[name] = fig, fig.add_subplot()
+    fig, ax = _FIGURES[name]
+
+    # The previous plot may still be being written out
+    pending = _PENDING.pop(fig, None)
+    if pending is not None:
+        pending.result()
+
+    # Drop colorbars attached to the previous plot before clearing
+    for artist in ax.collections:
+        if artist.colorbar is not None:
+            artist.colorbar.remove()
+    ax.cla()
+
+    # Constrained layout starts from the current axes position, so undo
+    # whatever the previous plot left behind to render like a fresh figure.
+    # set_position opts the axes out of the layout, so opt it back in.
+    ax.set_position(ax.get_subplotspec().get_position(fig), which="both")
+    ax.set_in_layout(True)
+    return fig, ax
+
+
+def _save_figure(fig, path, **kwargs):
+    """Write ``fig`` to ``path`` in the background."""
+    global _SAVER
+    if _SAVER is None:
+        _SAVER = ThreadPoolExecutor(max_workers=SAVE_THREADS)
+    _PENDING[fig] = _SAVER.submit(fig.savefig, path, **kwargs)
+
+
+def _wait_for_saves():
+    for pending in _PENDING.values():
+        pending.result()
+    _PENDING.clear()
+
+
+def _close_figures():
+    _wait_for_saves()
+    _FIGURES.clear()
+
+
+def _render_and_wait(job):
+    # Pool workers finish their saves before reporting the task as done
+    render, task = job
+    render(task)
+    _wait_for_saves()
+
+
+def _run_tasks(render, tasks, pool=None):
+    """Render every task, in ``pool`` when given, otherwise in this process."""
+    if pool is None:
+        for task in tasks:
+            render(task)
+        _close_figures()
+    else:
+        # Tasks are few and each renders several PNGs, so hand them out singly
+        jobs = [(render, task) for task in tasks]
+        for _ in pool.imap_unordered(_render_and_wait, jobs, chunksize=1):
+            pass
+
+
+def _draw_curves(ax, curves, labels):
+    """Draw ``curves`` as a single LineCollection and return legend handles.
+
+    Each curve is an (N, 2) array of points. Colours follow the default
+    property cycle, so the plot looks the same as one ``ax.plot`` per curve.
+    """
+    mpl = _matplotlib()
+    prop_cycle = itertools.cycle(mpl.rcParams["axes.prop_cycle"])
+    colors = [props["color"] for props, _ in zip(prop_cycle, curves)]
+
+    # Match Line2D's default caps/joins so line ends render as with ax.plot
+    ax.add_collection(mpl.collections.LineCollection(curves, colors=colors, capstyle="projecting", joinstyle="round"))
+    ax.autoscale_view()
+
+    return [mpl.lines.Line2D([], [], color=c, label=label) for c, label in zip(colors, labels)]
+
+
+def _render_efficiencies(task):
+    disp, disp_group, output_dir = task
+
+    # Limit number of curves (e.g., unique pressure values)
+    unique_dps = sorted(disp_group["RoundedDeltap"].unique())
+    step = max(len(unique_dps) // 8, 1)  # show ~8 curves max
+    filtered_dps = unique_dps[::step]
+
+    # Drop the skipped pressures up front, then sort once so every remaining
+    # curve is a contiguous, speed-ordered block
+    dg = disp_group[disp_group["RoundedDeltap"].isin(filtered_dps)]
+    dg = dg.sort_values(["RoundedDeltap", "Speed"])
+
+    # Collect the curves of all efficiencies in a single pass over the group
+    curves = {k: [] for k in EFFICIENCY_LABELS}
+    labels = []
+    for dp, sub_group in dg.groupby("RoundedDeltap", sort=False, observed=True):
+        speed = sub_group["Speed"].values
+        for eff_key, eff_curves in curves.items():
+            eff_curves.append(np.column_stack([speed, sub_group[eff_key].values]))
+        labels.append(f"Δp = {dp:.1f} MPa")
+
+    for eff_key, eff_label in EFFICIENCY_LABELS.items():
+        fig, ax = _reusable_axes(f"efficiencies_{eff_key}")
+        handles = _draw_curves(ax, curves[eff_key], labels)
+
+        ax.set_xlabel("Speed [RPM]")
+        ax.set_ylabel(eff_label)
+        ax.set_title(f"{eff_label} vs Speed (Displacement = {disp} cc/rev)")
+        ax.grid(True)
+
+        # Move legend below the plot
+        ax.legend(handles=handles, loc='upper center', bbox_to_anchor=(0.5, -0.15), ncol=3, frameon=True)
+
+        filename = f"{eff_key.lower()}_vs_speed_disp_{disp}.png"
+        _save_figure(fig, os.path.join(output_dir, filename))
+
+
+def plot_efficiencies(df: pd.DataFrame, output_dir=OUTPUT_DIR, pool=None):
     os.makedirs(output_dir, exist_ok=True)
 
-    efficiency_labels = {
-        "Etat": "Overall Efficiency (Etat) [%]",
-        "Etav": "Volumetric Efficiency (Etav) [%]",
-        "Etam": "Hydromechanical Efficiency (Etam) [%]"
-    }
+    tasks = [(disp, disp_group, output_dir)
+             for disp, disp_group in df.groupby("RoundedDisplacement", observed=True)]
+    _run_tasks(_render_efficiencies, tasks, pool)
 
-    for disp, disp_group in df.groupby("RoundedDisplacement"):
-        for eff_key, eff_label in efficiency_labels.items():
-            plt.figure(figsize=(8, 6))
-            ax = plt.gca()
 
-            # Limit number of curves (e.g., unique pressure values)
-            unique_dps = sorted(disp_group["RoundedDeltap"].unique())
-            step = max(len(unique_dps) // 8, 1)  # show ~8 curves max
-            filtered_dps = unique_dps[::step]
+def _render_efficiencies_sep(task):
+    target_dp, dp_group, output_dir = task
 
-            for dp in filtered_dps:
-                sub_group = disp_group[disp_group["RoundedDeltap"] == dp].sort_values("Speed")
-                ax.plot(sub_group["Speed"], sub_group[eff_key], label=f"Δp = {dp:.1f} MPa")
+    # Sort once so every displacement curve is a contiguous, speed-ordered block
+    dp_group = dp_group.sort_values(["RoundedDisplacement", "Speed"])
 
-            ax.set_xlabel("Speed [RPM]")
-            ax.set_ylabel(eff_label)
-            ax.set_title(f"{eff_label} vs Speed (Displacement = {disp} cc/rev)")
-            ax.grid(True)
+    # Collect the curves of all efficiencies in a single pass, grouped by displacement
+    curves = {k: [] for k in EFFICIENCY_LABELS}
+    labels = []
+    for disp, sub_group in dp_group.groupby("RoundedDisplacement", sort=False, observed=True):
+        speed = sub_group["Speed"].values
+        for eff_key, eff_curves in curves.items():
+            eff_curves.append(np.column_stack([speed, sub_group[eff_key].values]))
+        labels.append(f"{disp} cc/rev")
 
-            # Move legend below the plot
-            ax.legend(loc='upper center', bbox_to_anchor=(0.5, -0.15), ncol=3, frameon=True)
+    for eff_key, eff_label in EFFICIENCY_LABELS.items():
+        fig, ax = _reusable_axes(f"efficiencies_sep_{eff_key}")
+        handles = _draw_curves(ax, curves[eff_key], labels)
 
-            plt.tight_layout()
-            filename = f"{eff_key.lower()}_vs_speed_disp_{disp}.png"
-            plt.savefig(os.path.join(output_dir, filename), bbox_inches='tight')
-            plt.close()
+        ax.set_xlabel("Speed [RPM]")
+        ax.set_ylabel(eff_label)
+        ax.set_title(f"{eff_label} vs Speed\n(Δp ≈ {target_dp} MPa)")
+        ax.grid(True)
 
-def plot_efficiencies_sep(df: pd.DataFrame, output_dir=OUTPUT_DIR):
+        # Place legend below plot
+        ax.legend(handles=handles, loc='upper center', bbox_to_anchor=(0.5, -0.15), ncol=3, frameon=True)
+
+        filename = f"{eff_key.lower()}_vs_speed_dp_{int(target_dp)}mpa.png"
+        _save_figure(fig, os.path.join(output_dir, filename))
+
+
+def plot_efficiencies_sep(df: pd.DataFrame, output_dir=OUTPUT_DIR, pool=None):
     os.makedirs(output_dir, exist_ok=True)
 
     target_pressures = [11.0, 32.0, 38.0]  # in MPa
     tolerance = 0.2  # to allow for float imprecision
 
-    efficiency_labels = {
-        "Etat": "Overall Efficiency (Etat) [%]",
-        "Etav": "Volumetric Efficiency (Etav) [%]",
-        "Etam": "Hydromechanical Efficiency (Etam) [%]"
-    }
+    # Sort by Δp once so each pressure window is a contiguous slice
+    df_sorted = df.sort_values("Deltap", kind="stable")
+    dp_arr = df_sorted["Deltap"].to_numpy()
 
+    tasks = []
     for target_dp in target_pressures:
-        # Filter data near the target pressure
-        dp_group = df[(df["Deltap"] - target_dp).abs() <= tolerance]
+        # Select data near the target pressure
+        lo = np.searchsorted(dp_arr, target_dp - tolerance, side="left")
+        hi = np.searchsorted(dp_arr, target_dp + tolerance, side="right")
+        dp_group = df_sorted.iloc[lo:hi]
 
         if dp_group.empty:
             print(f"No data found for Δp ≈ {target_dp} MPa")
             continue
 
-        for eff_key, eff_label in efficiency_labels.items():
-            plt.figure(figsize=(8, 6))
-            ax = plt.gca()
+        tasks.append((target_dp, dp_group, output_dir))
 
-            # Group by displacement
-            for disp, sub_group in dp_group.groupby("RoundedDisplacement"):
-                sub_group_sorted = sub_group.sort_values("Speed")
-                ax.plot(sub_group_sorted["Speed"], sub_group_sorted[eff_key],
-                        label=f"{disp} cc/rev")
+    _run_tasks(_render_efficiencies_sep, tasks, pool)
 
-            ax.set_xlabel("Speed [RPM]")
-            ax.set_ylabel(eff_label)
-            ax.set_title(f"{eff_label} vs Speed\n(Δp ≈ {target_dp} MPa)")
-            ax.grid(True)
 
-            # Place legend below plot
-            ax.legend(loc='upper center', bbox_to_anchor=(0.5, -0.15), ncol=3, frameon=True)
+def _render_efficiency_contours(task):
+    disp, group, output_dir = task
 
-            plt.tight_layout()
-            filename = f"{eff_key.lower()}_vs_speed_dp_{int(target_dp)}mpa.png"
-            plt.savefig(os.path.join(output_dir, filename), bbox_inches='tight')
-            plt.close()
+    # One pivot for all efficiencies; they share the speed/pressure grid
+    # Speed on the Y-axis, Δp on the X-axis
+    pivot = group.set_index(["Speed", "RoundedDeltap"])[list(EFFICIENCY_LABELS)].unstack("RoundedDeltap")
 
+    dps = pivot.columns.get_level_values("RoundedDeltap").unique().sort_values()
 
+    if len(pivot.index) < 2 or len(dps) < 2:
+        return  # Not enough data to contour
 
-def plot_efficiency_contours(df: pd.DataFrame, output_dir="contour_plots"):
-    os.makedirs(output_dir, exist_ok=True)
+    X, Y = np.meshgrid(dps, pivot.index)
+
+    for eff_key, eff_label in EFFICIENCY_LABELS.items():
+        Z = pivot[eff_key].reindex(columns=dps).values
+
+        fig, ax = _reusable_axes(f"contour_{eff_key}")
+        # Use pcolormesh so only existing data are drawn with no interpolation
+        mesh = ax.pcolormesh(
+            X,
+            Y,
+            np.ma.masked_invalid(Z),
+            cmap="viridis",
+            shading="nearest",
+            rasterized=True,
+        )
+        cbar = fig.colorbar(mesh, ax=ax)
+        cbar.set_label(eff_label)
+
+        ax.set_xlabel("Δp [MPa]")
+        ax.set_ylabel("Speed [RPM]")
+        ax.set_title(f"{eff_label} Contour\n(Displacement = {disp} cc/rev)")
+        ax.grid(True)
+
+        filename = f"{eff_key.lower()}_contour_disp_{disp}.png"
+        _save_figure(fig, os.path.join(output_dir, filename), dpi=MAP_DPI)
 
-    efficiency_labels = {
-        "Etat": "Overall Efficiency (Etat) [%]",
-        "Etav": "Volumetric Efficiency (Etav) [%]",
-        "Etam": "Hydromechanical Efficiency (Etam) [%]"
-    }
-
-    # Round values for consistency
-    df["RoundedDisplacement"] = df["Displacement"].round().astype(int)
-    df["RoundedDeltap"] = df["Deltap"].round(1)
-
-    for disp, group in df.groupby("RoundedDisplacement"):
-        for eff_key, eff_label in efficiency_labels.items():
-            pivot = group.pivot_table(
-                index="Speed",               # Y-axis
-                columns="RoundedDeltap",    # X-axis
-                values=eff_key,
-                aggfunc='mean'
-            )
-
-            if pivot.shape[0] < 2 or pivot.shape[1] < 2:
-                continue  # Not enough data to contour
-
-            X, Y = np.meshgrid(pivot.columns, pivot.index)
-            Z = pivot.values
-
-            plt.figure(figsize=(8, 6))
-            # Use pcolormesh so only existing data are drawn with no interpolation
-            mesh = plt.pcolormesh(
-                X,
-                Y,
-                np.ma.masked_invalid(Z),
-                cmap="viridis",
-                shading="nearest",
-            )
-            cbar = plt.colorbar(mesh)
-            cbar.set_label(eff_label)
-
-            plt.xlabel("Δp [MPa]")
-            plt.ylabel("Speed [RPM]")
-            plt.title(f"{eff_label} Contour\n(Displacement = {disp} cc/rev)")
-            plt.grid(True)
-
-            filename = f"{eff_key.lower()}_contour_disp_{disp}.png"
-            plt.savefig(os.path.join(output_dir, filename), bbox_inches='tight')
-            plt.close()
-
-def plot_total_efficiency_field(df: pd.DataFrame, output_dir="efficiency_fields"):
+
+def plot_efficiency_contours(df: pd.DataFrame, output_dir="contour_plots", pool=None):
     os.makedirs(output_dir, exist_ok=True)
 
-    df["RoundedDisplacement"] = df["Displacement"].round().astype(int)
-    df["RoundedDeltap"] = df["Deltap"].round(1)
+    tasks = [(disp, group, output_dir)
+             for disp, group in df.groupby("RoundedDisplacement", observed=True)]
+    _run_tasks(_render_efficiency_contours, tasks, pool)
 
-    for disp, group in df.groupby("RoundedDisplacement"):
-        pivot = group.pivot_table(
-            index="Speed",               # Y-axis
-            columns="RoundedDeltap",    # X-axis
-            values="Etat",              # Efficiency
-            aggfunc='mean'
-        )
 
-        if pivot.shape[0] < 2 or pivot.shape[1] < 2:
-            continue
+def _render_total_efficiency_field(task):
+    disp, group, output_dir = task
 
-        X, Y = np.meshgrid(pivot.columns, pivot.index)
-        Z = pivot.values
+    # Speed on the Y-axis, Δp on the X-axis, total efficiency as the value
+    pivot = group.set_index(["Speed", "RoundedDeltap"])["Etat"].unstack("RoundedDeltap")
 
-        plt.figure(figsize=(8, 6))
-        # NaN values can appear in Z if some speed/pressure combinations are
-        # missing. Skip plotting if nothing is available.
-        if np.all(~np.isfinite(Z)):
-            continue
+    if pivot.shape[0] < 2 or pivot.shape[1] < 2:
+        return
 
-        masked_Z = np.ma.masked_invalid(Z)
-        min_eff = np.floor(np.nanmin(Z))
-        max_eff = np.ceil(np.nanmax(Z))
+    X, Y = np.meshgrid(pivot.columns, pivot.index)
+    Z = pivot.values
 
-        mesh = plt.pcolormesh(
-            X,
-            Y,
-            masked_Z,
-            cmap="inferno",
-            shading="nearest",
-            vmin=min_eff,
-            vmax=max_eff,
-        )
-        cbar = plt.colorbar(mesh)
-        cbar.set_label("Total Efficiency [%]")
+    # NaN values can appear in Z if some speed/pressure combinations are
+    # missing. Skip plotting if nothing is available.
+    if np.all(~np.isfinite(Z)):
+        return
 
-        # Labels and style
-        plt.xlabel("Pressure difference Δp [MPa]")
-        plt.ylabel("Speed [RPM]")
-        plt.title(f"Total Efficiency Map\nDisplacement = {disp} cc/rev")
-        plt.grid(True)
+    masked_Z = np.ma.masked_invalid(Z)
+    min_eff = np.floor(np.nanmin(Z))
+    max_eff = np.ceil(np.nanmax(Z))
 
-        # Save
-        filename = f"efficiency_map_disp_{disp}.png"
-        plt.savefig(os.path.join(output_dir, filename), bbox_inches='tight')
-        plt.close()
+    fig, ax = _reusable_axes("field")
+    mesh = ax.pcolormesh(
+        X,
+        Y,
+        masked_Z,
+        cmap="inferno",
+        shading="nearest",
+        vmin=min_eff,
+        vmax=max_eff,
+        rasterized=True,
+    )
+    cbar = fig.colorbar(mesh, ax=ax)
+    cbar.set_label("Total Efficiency [%]")
+
+    # Labels and style
+    ax.set_xlabel("Pressure difference Δp [MPa]")
+    ax.set_ylabel("Speed [RPM]")
+    ax.set_title(f"Total Efficiency Map\nDisplacement = {disp} cc/rev")
+    ax.grid(True)
+
+    # Save
+    filename = f"efficiency_map_disp_{disp}.png"
+    _save_figure(fig, os.path.join(output_dir, filename), dpi=MAP_DPI)
+
+
+def plot_total_efficiency_field(df: pd.DataFrame, output_dir="efficiency_fields", pool=None):
+    os.makedirs(output_dir, exist_ok=True)
+
+    tasks = [(disp, group, output_dir)
+             for disp, group in df.groupby("RoundedDisplacement", observed=True)]
+    _run_tasks(_render_total_efficiency_field, tasks, pool)
 
 
 def main():
     df = load_and_prepare_data()
-    plot_efficiencies(df)
+    # Import matplotlib before forking so the workers inherit it
+    _matplotlib()
+
+    # Every (plot, displacement/pressure) task is independent, so render
+    # them across all cores
+    with multiprocessing.Pool(os.cpu_count()) as pool:
+        plot_efficiencies(df, pool=pool)
 
-    plot_efficiencies_sep(df,Output_sepa)
-    plot_efficiency_contours(df)
-    plot_total_efficiency_field(df)
+        plot_efficiencies_sep(df, Output_sepa, pool=pool)
+        plot_efficiency_contours(df, pool=pool)
+        plot_total_efficiency_field(df, pool=pool)
 
 
 if __name__ == "__main__":
@@ -5,19 +5,17 @@ Reads `V32HL56-efficiency test.txt` and writes a CSV file with Unix
 line endings named `V32HL56-efficiency.csv`.
 """
 
-import csv
-
 INPUT_FILE = "V32HL56-efficiency test.txt"
 OUTPUT_FILE = "V32HL56-efficiency.csv"
 
 
 def convert(in_path: str = INPUT_FILE, out_path: str = OUTPUT_FILE) -> None:
     """Convert the input text file to CSV with Unix newlines."""
-    with open(in_path, newline="") as src, open(out_path, "w", newline="") as dst:
-        reader = csv.reader(src)
-        writer = csv.writer(dst)
-        for row in reader:
-            writer.writerow(row)
+    # The input is already comma separated, so only the line endings change
+    with open(in_path, "rb") as src:
+        data = src.read()
+    with open(out_path, "wb") as dst:
+        dst.write(data.replace(b"\r\n", b"\n"))
 
 
 if __name__ == "__main__":